@@ -1,4 +1,9 @@
 import functools
+import sys
+
+@functools.lru_cache(maxsize=64)
+def _tag_strs(tag):
+    return (f"<{tag}>", f"</{tag}>")
 
 class HTMLNode():
     """
@@ -12,28 +17,56 @@ class HTMLNode():
         to_html():
             Abstract method to convert the node and its children to an HTML string.
             Must be implemented by subclasses.
+        render_to(file_writer):
+            Writes the node's HTML to a file-like object with a write(str) method.
         props_to_html():
             Converts the props dictionary to a string of HTML attributes.
-            Returns an empty string if no props are set.
+            Returns an empty string if no props are set. The result is cached on
+            first call, so props must not be mutated after construction.
         __repr__():
-            Returns a string representation of the HTMLNode instance.
+            Returns a shallow string representation of the HTMLNode instance,
+            summarising children by count.
+        debug_repr():
+            Returns the full recursive representation, including every child.
     """
+    __slots__ = ("tag", "value", "children", "props", "_props_html")
+
     def __init__(self, tag=None, value=None, children=None, props=None):
         self.tag = tag
         self.value = value
         self.children = children
         self.props = props
+        self._props_html = None
 
     def to_html(self):
         raise NotImplementedError("to_html method not implemented")
+
+    def render_to(self, file_writer):
+        file_writer.write(self.to_html())
     
     def props_to_html(self):
-        if not self.props:
-            return ""
-        return functools.reduce(lambda acc, item: acc + f' {item[0]}="{item[1]}"', self.props.items(), "")
+        if self._props_html is None:
+            if not self.props:
+                self._props_html = ""
+            else:
+                self._props_html = "".join(f' {key}="{value}"' for key, value in self.props.items())
+        return self._props_html
 
     def __repr__(self):
-        return f"HTMLNode({self.tag}, {self.value}, children: {self.children}, {self.props})"
+        return f"HTMLNode({self.tag}, {self.value}, children: {self._children_summary()}, {self.props})"
+
+    def debug_repr(self):
+        return f"HTMLNode({self.tag}, {self.value}, children: {self._children_debug_repr()}, {self.props})"
+
+    def _children_summary(self):
+        if self.children is None:
+            return None
+        return f"{len(self.children)} children"
+
+    def _children_debug_repr(self):
+        if self.children is None:
+            return None
+        return f"[{', '.join(child.debug_repr() for child in self.children)}]"
 
 class LeafNode(HTMLNode):
     """
@@ -42,26 +75,31 @@ class LeafNode(HTMLNode):
         tag (str): The HTML tag for the element (e.g., 'p', 'span'). If None, only the value is rendered.
         value (str): The text or content of the HTML element.
         props (dict, optional): A dictionary of HTML attributes for the element. Defaults to None.
+    Raises:
+        ValueError: If no value is provided for the node.
     Methods:
         to_html():
             Returns the HTML string representation of the node.
-            Raises:
-                ValueError: If no value is provided for the node.
         __repr__():
             Returns a string representation of the LeafNode instance.
     """
+    __slots__ = ()
+
     def __init__(self, tag, value, props=None):
+        if value == None:
+            raise ValueError("Invalid HTML: no value given")
         super().__init__(tag, value, None, props)
     
     def to_html(self):
-        if self.value == None:
-            raise ValueError("Invalid HTML: no value given")
         if self.tag == None:
             return self.value
         return f"<{self.tag}{self.props_to_html()}>{self.value}</{self.tag}>"
     
     def __repr__(self):
         return f"LeafNode({self.tag}, {self.value}, {self.props})"
+
+    def debug_repr(self):
+        return repr(self)
  
 class ParentNode(HTMLNode):
     """
@@ -72,29 +110,64 @@ class ParentNode(HTMLNode):
         children (list[HTMLNode]): A list of child HTMLNode instances.
         props (dict, optional): A dictionary of HTML attributes for this node.
 
+    Raises:
+        ValueError: If the tag or children are not provided.
+
     Methods:
         to_html():
             Converts the ParentNode and its children into an HTML string.
-            Raises:
-                ValueError: If the tag or children are not provided.
+            The subtree is walked iteratively with an explicit stack (closing
+            tags are pushed as plain strings), so deep nesting costs no Python
+            frames, and every piece is joined once at the end. Tag strings are
+            interned and their open/close markup is shared between nodes.
+
+        render_to(file_writer):
+            Streams the same pieces as to_html() to file_writer as they are
+            produced, without building the whole document string.
 
         __repr__():
-            Returns a string representation of the ParentNode instance.
+            Returns a shallow string representation of the ParentNode instance,
+            summarising children by count.
+
+        debug_repr():
+            Returns the full recursive representation, including every child.
     """
+    __slots__ = ("_open_tag", "_close_tag")
+
     def __init__(self, tag, children, props=None):
+        if tag == None:
+            raise ValueError("Invalid HTML: no tag given")
+        if children == None:
+            raise ValueError("Invalid HTML: no children nodes given")
+        tag = sys.intern(tag)
+        open_tag, self._close_tag = _tag_strs(tag)
+        self._open_tag = None if props else open_tag
         super().__init__(tag, None, children, props)
 
     def to_html(self):
-        if self.tag == None:
-            raise ValueError("Invalid HTML: no tag given")
-        if self.children == None:
-            raise ValueError("Invalid HTML: no children nodes given")
+        return "".join(self._html_pieces())
 
-        child_nodes_to_html = ""
-        for child in self.children:
-            child_nodes_to_html += child.to_html()
+    def render_to(self, file_writer):
+        for piece in self._html_pieces():
+            file_writer.write(piece)
 
-        return f"<{self.tag}{self.props_to_html()}>{child_nodes_to_html}</{self.tag}>"
+    def _html_pieces(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                yield node
+                continue
+            if not isinstance(node, ParentNode):
+                yield node.to_html()
+                continue
+
+            yield node._open_tag or f"<{node.tag}{node.props_to_html()}>"
+            stack.append(node._close_tag)
+            stack.extend(reversed(node.children))
 
     def __repr__(self):
-        return f"ParentNode({self.tag}, children: {self.children}, {self.props})"
+        return f"ParentNode({self.tag}, children: {self._children_summary()}, {self.props})"
+
+    def debug_repr(self):
+        return f"ParentNode({self.tag}, children: {self._children_debug_repr()}, {self.props})"
@@ -24,6 +24,48 @@ class BlockType(Enum):
     UNORDERED_LIST = "unordered_list"
     ORDERED_LIST = "ordered_list"
 
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_CODE_RE = re.compile(r"^```[\s\S]*?```$", re.MULTILINE | re.DOTALL)
+_ORDERED_ITEM_RE = re.compile(r"(\d+)\. .")
+
+def _non_blank_lines(markdown_block):
+    return [line for line in markdown_block.splitlines() if line.strip()]
+
+def _heading_block_type(markdown_block):
+    return BlockType.HEADING if _HEADING_RE.match(markdown_block) else BlockType.PARAGRAPH
+
+def _code_block_type(markdown_block):
+    return BlockType.CODE if _CODE_RE.match(markdown_block) else BlockType.PARAGRAPH
+
+def _quote_block_type(markdown_block):
+    if all(line.startswith(">") for line in _non_blank_lines(markdown_block)):
+        return BlockType.QUOTE
+    return BlockType.PARAGRAPH
+
+def _unordered_list_block_type(markdown_block):
+    if all(line.startswith("- ") and len(line) > 2 for line in _non_blank_lines(markdown_block)):
+        return BlockType.UNORDERED_LIST
+    return BlockType.PARAGRAPH
+
+def _ordered_list_block_type(markdown_block):
+    for i, line in enumerate(_non_blank_lines(markdown_block), start=1):
+        match = _ORDERED_ITEM_RE.match(line)
+        if not match or int(match.group(1)) != i:
+            return BlockType.PARAGRAPH
+    return BlockType.ORDERED_LIST
+
+_LINE_BLOCK_TYPE_DISPATCH = {
+    ">": _quote_block_type,
+    "-": _unordered_list_block_type,
+    **{digit: _ordered_list_block_type for digit in "0123456789"},
+}
+
+_BLOCK_TYPE_DISPATCH = {
+    "#": _heading_block_type,
+    "`": _code_block_type,
+    **_LINE_BLOCK_TYPE_DISPATCH,
+}
+
 def markdown_to_blocks(markdown):
     """
     Splits a markdown string into a list of blocks, separated by double newlines.
@@ -36,11 +78,27 @@ def markdown_to_blocks(markdown):
     Returns:
         list of str: A list of non-empty, stripped markdown blocks.
     """
-    return list(filter(lambda x: x != "", list(map(lambda x: x.strip(), markdown.split("\n\n")))))
+    return [block for block in (raw.strip() for raw in markdown.split("\n\n")) if block]
+
+def _first_block(markdown):
+    """
+    Returns the first non-empty block of a markdown string, as markdown_to_blocks would,
+    without splitting the rest of the document.
+    """
+    start = 0
+    while True:
+        end = markdown.find("\n\n", start)
+        if end == -1:
+            return markdown[start:].strip()
+        block = markdown[start:end].strip()
+        if block:
+            return block
+        start = end + 2
 
 def extract_title(markdown):
     """
     Extracts the title from a Markdown string by retrieving the first block as an H1 header.
+    Only the text up to the end of the first block is scanned.
 
     Args:
         markdown (str): The Markdown content as a string.
@@ -51,8 +109,7 @@ def extract_title(markdown):
     Raises:
         ValueError: If the Markdown does not begin with an H1 header (i.e., a line starting with '# ').
     """
-    blocks = markdown_to_blocks(markdown)
-    header = blocks[0]
+    header = _first_block(markdown)
     if not header.startswith("# "):
         raise ValueError("Invalid Markdown: markdown must begin with h1 header")
     return header[2:]
@@ -68,39 +125,28 @@ def block_to_block_type(markdown_block):
         BlockType: The type of the Markdown block, such as HEADING, CODE, QUOTE, UNORDERED_LIST,
                    ORDERED_LIST, or PARAGRAPH.
     Notes:
-        - Multi-line patterns (e.g., headings, code blocks) are checked first if the block starts
-          with '#' or '`'.
-        - Single-line patterns (e.g., quotes, lists) are checked for all lines in the block.
-        - Ordered lists require that each line starts with an incrementing number.
+        - The first character of the block selects the only block type it could be, and just
+          that type's pattern is checked; any other first character is a PARAGRAPH. Blocks with
+          leading whitespace dispatch on their first non-blank character to the line-based types.
+        - Multi-line patterns (headings, code blocks) are matched against the whole block.
+        - Quotes and lists are checked with plain prefix tests on every non-blank line.
+        - Ordered lists require that each line starts with an incrementing number, in any
+          Unicode decimal digits.
         - If no pattern matches, the block is classified as a PARAGRAPH.
     """
-    multi_line_md_patterns = [
-        (BlockType.HEADING, re.compile(r"^(#{1,6})\s+(.+)$")),
-        (BlockType.CODE, re.compile(r"^```[\s\S]*?```$", re.MULTILINE | re.DOTALL))
-    ]
-
-    single_line_md_patterns = [
-        (BlockType.QUOTE, re.compile(r"^>.*$")),
-        (BlockType.UNORDERED_LIST, re.compile(r"^- .+$")),
-        (BlockType.ORDERED_LIST, re.compile(r"^(\d+)\. .+"))
-    ]
-
-    if markdown_block[0] in ("#", "`"):
-        for block_type, pattern in multi_line_md_patterns:
-            if pattern.match(markdown_block):
-                return block_type
-    else:
-        lines = [line for line in markdown_block.splitlines() if line.strip()]
-        for block_type, pattern in single_line_md_patterns:
-            if block_type == BlockType.ORDERED_LIST:
-                if all((match := pattern.match(line)) and int(match.group(1)) == i for i, line in enumerate(lines, start=1)):
-                    return block_type
-            else:
-                if all(pattern.match(line) for line in lines):
-                    return block_type
-
-    
-    return BlockType.PARAGRAPH
+    first_char = markdown_block[0]
+    block_type_check = _BLOCK_TYPE_DISPATCH.get(first_char)
+    if block_type_check is None and first_char.isspace():
+        stripped_block = markdown_block.lstrip()
+        if stripped_block:
+            first_char = stripped_block[0]
+            block_type_check = _LINE_BLOCK_TYPE_DISPATCH.get(first_char)
+    # The tables only key ASCII digits; any other Unicode digit can still start an ordered list.
+    if block_type_check is None and first_char.isdigit():
+        block_type_check = _ordered_list_block_type
+    if block_type_check is None:
+        return BlockType.PARAGRAPH
+    return block_type_check(markdown_block)
 
 def markdown_to_html_node(markdown):
     """
@@ -112,14 +158,31 @@ def markdown_to_html_node(markdown):
     Returns:
         ParentNode: A ParentNode object with tag "div" containing the HTML nodes generated from the markdown blocks.
     """
-    blocks = markdown_to_blocks(markdown)
-    children = []
-    for block in blocks:
-        html_node = block_to_html_node(block)
-        children.append(html_node)
+    children = [block_to_html_node(block) for block in markdown_to_blocks(markdown)]
     return ParentNode("div", children, None)
 
 
+def markdown_to_page(markdown):
+    """
+    Converts a markdown string into its page title and HTML node in a single pass over its blocks.
+
+    Args:
+        markdown (str): The markdown text to be converted.
+
+    Returns:
+        tuple: The title (str) taken from the leading H1 header, and a ParentNode with tag "div"
+        containing the HTML nodes generated from the markdown blocks.
+
+    Raises:
+        ValueError: If the Markdown does not begin with an H1 header (i.e., a line starting with '# ').
+    """
+    blocks = markdown_to_blocks(markdown)
+    if not blocks or not blocks[0].startswith("# "):
+        raise ValueError("Invalid Markdown: markdown must begin with h1 header")
+    children = [block_to_html_node(block) for block in blocks]
+    return blocks[0][2:], ParentNode("div", children, None)
+
+
 def block_to_html_node(block):
     """
     Converts a markdown block to its corresponding HTML node representation.
@@ -163,12 +226,7 @@ def text_to_children(text):
     Returns:
         list: A list of HTML node objects generated from the input text.
     """
-    text_nodes = text_to_text_nodes(text)
-    children = []
-    for text_node in text_nodes:
-        html_node = text_node_to_html_node(text_node)
-        children.append(html_node)
-    return children
+    return [text_node_to_html_node(text_node) for text_node in text_to_text_nodes(text)]
 
 
 def paragraph_to_html_node(block):
@@ -245,13 +303,7 @@ def olist_to_html_node(block):
     Returns:
         ParentNode: An HTML node representing the ordered list (<ol>) with child <li> nodes for each list item.
     """
-    items = block.split("\n")
-    html_items = []
-    for item in items:
-        text = item[3:]
-        children = text_to_children(text)
-        html_items.append(ParentNode("li", children))
-    return ParentNode("ol", html_items)
+    return ParentNode("ol", [ParentNode("li", text_to_children(item[3:])) for item in block.split("\n")])
 
 
 def ulist_to_html_node(block):
@@ -264,13 +316,7 @@ def ulist_to_html_node(block):
     Returns:
         ParentNode: An HTML node representing the unordered list (<ul>) with each item as a child <li> node.
     """
-    items = block.split("\n")
-    html_items = []
-    for item in items:
-        text = item[2:]
-        children = text_to_children(text)
-        html_items.append(ParentNode("li", children))
-    return ParentNode("ul", html_items)
+    return ParentNode("ul", [ParentNode("li", text_to_children(item[2:])) for item in block.split("\n")])
 
 
 def quote_to_html_node(block):
@@ -287,11 +333,8 @@ def quote_to_html_node(block):
         ValueError: If any line in the block does not start with '>'.
     """
     lines = block.split("\n")
-    new_lines = []
-    for line in lines:
-        if not line.startswith(">"):
-            raise ValueError("invalid quote block")
-        new_lines.append(line.lstrip(">").strip())
-    content = " ".join(new_lines)
+    if not all(line.startswith(">") for line in lines):
+        raise ValueError("invalid quote block")
+    content = " ".join([line.lstrip(">").strip() for line in lines])
     children = text_to_children(content)
     return ParentNode("blockquote", children)
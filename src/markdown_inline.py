@@ -1,6 +1,41 @@
+import functools
 import re
 
-from textnode import TextNode, TextType
+from textnode import _CACHED_HTML_NODE_MAX_LEN, TextNode, TextType
+
+_INLINE_TRIGGERS = frozenset("*_`![")
+
+_IMAGE_RE = re.compile(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)")
+_LINK_RE = re.compile(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)")
+
+_INLINE_RE = re.compile(
+    r"\*\*(?P<bold>.*?)\*\*"
+    r"|_(?P<italic>.*?)_"
+    r"|`(?P<code>.*?)`"
+    r"|(?P<image>!\[(?P<image_alt>[^\[\]]*)\]\((?P<image_url>[^\(\)]*)\))"
+    r"|(?P<link>\[(?P<link_text>[^\[\]]*)\]\((?P<link_url>[^\(\)]*)\))",
+    re.DOTALL
+)
+
+def _has_inline_markup(text):
+    """
+    Returns True if the text contains any character that can start inline markdown.
+    """
+    return not _INLINE_TRIGGERS.isdisjoint(text)
+
+@functools.lru_cache(maxsize=512)
+def _cached_text_node(text):
+    return TextNode(text, TextType.TEXT)
+
+def _text_node(text):
+    """
+    Returns a TEXT node for the text, reusing a shared instance for short runs such as
+    " and " that recur throughout a document. The length limit is shared with the HTML
+    node cache so shared nodes also hit that cache. Returned nodes must not be mutated.
+    """
+    if len(text) <= _CACHED_HTML_NODE_MAX_LEN:
+        return _cached_text_node(text)
+    return TextNode(text, TextType.TEXT)
 
 def split_nodes_delimiter(old_nodes, delimiter, text_type):
     """
@@ -19,18 +54,21 @@ def split_nodes_delimiter(old_nodes, delimiter, text_type):
         if node.text_type != TextType.TEXT:
             new_nodes.append(node)
             continue
+        if not node.text:
+            continue
+        if delimiter not in node.text:
+            new_nodes.append(node)
+            continue
         
         split_nodes = node.text.split(delimiter)
         if  len(split_nodes) % 2 == 0:
             raise ValueError("Invalid markdown: formatted section not closed")
         
-        for i in range(0, len(split_nodes)):
-            if split_nodes[i] == "":
-                continue
-            if i % 2 == 0:
-                new_nodes.append(TextNode(split_nodes[i], TextType.TEXT))
-            else:
-                new_nodes.append(TextNode(split_nodes[i], text_type))
+        new_nodes.extend([
+            TextNode(piece, text_type) if i & 1 else _text_node(piece)
+            for i, piece in enumerate(split_nodes)
+            if piece
+        ])
     
     return new_nodes
 
@@ -45,7 +83,9 @@ def extract_markdown_images(text):
         list of tuple: A list of tuples, each containing the alt text and URL of an image found in the Markdown text.
                        Each tuple is in the form (alt_text, url).
     """
-    return re.findall(r"!\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    if "![" not in text:
+        return []
+    return _IMAGE_RE.findall(text)
 
 def extract_markdown_links(text):
     """
@@ -62,7 +102,33 @@ def extract_markdown_links(text):
         - This function ignores image links (i.e., links starting with '!').
         - Only standard inline Markdown links of the form [text](url) are extracted.
     """
-    return re.findall(r"(?<!!)\[([^\[\]]*)\]\(([^\(\)]*)\)", text)
+    if "](" not in text:
+        return []
+    return _LINK_RE.findall(text)
+
+def _split_text_on_pattern(node, pattern, text_type):
+    """
+    Splits a single TEXT node on every match of an image or link pattern in one scan.
+
+    Each match becomes a node of the given text_type (group 1 as text, group 2 as url),
+    and the text between matches becomes TEXT nodes. Returns [node] unchanged if
+    nothing matches.
+    """
+    text = node.text
+    if "[" not in text:
+        return [node]
+    new_nodes = []
+    cursor = 0
+    for match in pattern.finditer(text):
+        if match.start() > cursor:
+            new_nodes.append(_text_node(text[cursor:match.start()]))
+        new_nodes.append(TextNode(match.group(1), text_type, match.group(2)))
+        cursor = match.end()
+    if cursor == 0:
+        return [node]
+    if cursor < len(text):
+        new_nodes.append(_text_node(text[cursor:]))
+    return new_nodes
 
 def split_nodes_image(old_nodes):
     """
@@ -72,8 +138,6 @@ def split_nodes_image(old_nodes):
     Returns:
         list: A new list of nodes where any Markdown image syntax (e.g., ![alt](src)) in text nodes
               is replaced by separate image nodes (with text_type=IMAGE) and text nodes.
-    Raises:
-        ValueError: If an image in the text is not properly formatted according to Markdown syntax.
     """
     new_nodes = []
     for node in old_nodes:
@@ -81,22 +145,7 @@ def split_nodes_image(old_nodes):
             new_nodes.append(node)
             continue
         
-        node_text = node.text
-        image_nodes = extract_markdown_images(node_text)
-        if len(image_nodes) == 0:
-            new_nodes.append(node)
-            continue
-
-        for image in image_nodes:
-            node_parts = node_text.split(f"![{image[0]}]({image[1]})", 1)
-            if len(node_parts) != 2:
-                raise ValueError("Invalid markdown: image not properly formatted")
-            if node_parts[0] != "":
-                new_nodes.append(TextNode(node_parts[0], TextType.TEXT))
-            new_nodes.append(TextNode(image[0], TextType.IMAGE, image[1]))
-            node_text = node_parts[1]
-        if node_text != "":
-            new_nodes.append(TextNode(node_text, TextType.TEXT))
+        new_nodes.extend(_split_text_on_pattern(node, _IMAGE_RE, TextType.IMAGE))
         
     return new_nodes
 
@@ -107,8 +156,6 @@ def split_nodes_link(old_nodes):
         old_nodes (list): A list of nodes, where each node is expected to have 'text' and 'text_type' attributes.
     Returns:
         list: A new list of nodes where any Markdown links in text nodes are split into separate text and link nodes.
-    Raises:
-        ValueError: If a link is not properly formatted in the input text.
     """
     new_nodes = []
     for node in old_nodes:
@@ -116,22 +163,7 @@ def split_nodes_link(old_nodes):
             new_nodes.append(node)
             continue
         
-        node_text = node.text
-        link_nodes = extract_markdown_links(node_text)
-        if len(link_nodes) == 0:
-            new_nodes.append(node)
-            continue
-            
-        for link in link_nodes:
-            node_parts = node_text.split(f"[{link[0]}]({link[1]})", 1)
-            if len(node_parts) != 2:
-                raise ValueError("Invalid markup: link not properly formatted")
-            if node_parts[0] != "":
-                new_nodes.append(TextNode(node_parts[0], TextType.TEXT))
-            new_nodes.append(TextNode(link[0], TextType.LINK, link[1]))
-            node_text = node_parts[1]
-        if node_text != "":
-            new_nodes.append(TextNode(node_text, TextType.TEXT))
+        new_nodes.extend(_split_text_on_pattern(node, _LINK_RE, TextType.LINK))
         
     return new_nodes
 
@@ -141,6 +173,14 @@ def text_to_text_nodes(text):
     splitting the text into nodes based on inline markdown syntax such as bold (**), 
     italic (_), code (`), images, and links.
 
+    All inline constructs are recognised in a single left-to-right scan of one
+    combined regex, pairing delimiters the same way str.split does and dropping
+    empty spans; text between matches becomes plain TEXT nodes. The split_nodes_*
+    passes give bold precedence over italic, italic over code, and all three over
+    images and links. If a match spans a delimiter of a higher-precedence construct,
+    or text left between matches still holds a delimiter, the whole text is parsed
+    with those passes instead, so the result always matches them exactly.
+
     Args:
         text (str): The input string containing markdown inline formatting.
 
@@ -148,8 +188,54 @@ def text_to_text_nodes(text):
         List[TextNode]: A list of TextNode objects representing the parsed segments 
         of the input text, each annotated with its corresponding TextType.
     """
-    text_node = TextNode(text, TextType.TEXT)
-    text_nodes = [text_node]
+    if not _has_inline_markup(text):
+        return [_text_node(text)] if text else []
+
+    text_nodes = []
+    cursor = 0
+    for match in _INLINE_RE.finditer(text):
+        if match.start() > cursor:
+            plain_text = text[cursor:match.start()]
+            if _has_delimiter(plain_text):
+                return _split_text_to_text_nodes(text)
+            text_nodes.append(_text_node(plain_text))
+        kind = match.lastgroup
+        if kind == "bold":
+            if match.group("bold"):
+                text_nodes.append(TextNode(match.group("bold"), TextType.BOLD))
+        elif kind == "italic":
+            if "**" in match.group():
+                return _split_text_to_text_nodes(text)
+            if match.group("italic"):
+                text_nodes.append(TextNode(match.group("italic"), TextType.ITALIC))
+        elif kind == "code":
+            if "**" in match.group() or "_" in match.group():
+                return _split_text_to_text_nodes(text)
+            if match.group("code"):
+                text_nodes.append(TextNode(match.group("code"), TextType.CODE))
+        elif _has_delimiter(match.group()):
+            return _split_text_to_text_nodes(text)
+        elif kind == "image":
+            text_nodes.append(TextNode(match.group("image_alt"), TextType.IMAGE, match.group("image_url")))
+        else:
+            text_nodes.append(TextNode(match.group("link_text"), TextType.LINK, match.group("link_url")))
+        cursor = match.end()
+    if cursor < len(text):
+        plain_text = text[cursor:]
+        if _has_delimiter(plain_text):
+            return _split_text_to_text_nodes(text)
+        text_nodes.append(_text_node(plain_text))
+    return text_nodes
+
+def _has_delimiter(text):
+    return "**" in text or "_" in text or "`" in text
+
+def _split_text_to_text_nodes(text):
+    """
+    Parses inline markdown with one split_nodes_* pass per construct. This is the
+    slow path text_to_text_nodes falls back to when the combined regex leaves a delimiter behind.
+    """
+    text_nodes = [TextNode(text, TextType.TEXT)]
     text_nodes = split_nodes_delimiter(text_nodes, "**", TextType.BOLD)
     text_nodes = split_nodes_delimiter(text_nodes, "_", TextType.ITALIC)
     text_nodes = split_nodes_delimiter(text_nodes, "`", TextType.CODE)
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from htmlnode import HTMLNode, LeafNode, ParentNode
@@ -34,6 +35,16 @@ class TestHtmlNode(unittest.TestCase):
         node = LeafNode("a", "Click me!", {"href": "www.boot.dev"})
         self.assertEqual(node.to_html(), '<a href="www.boot.dev">Click me!</a>')
     
+    def test_leaf_no_value(self):
+        with self.assertRaises(ValueError):
+            LeafNode("p", None)
+
+    def test_parent_no_tag_or_children(self):
+        with self.assertRaises(ValueError):
+            ParentNode(None, [])
+        with self.assertRaises(ValueError):
+            ParentNode("div", None)
+
     def test_leaf_to_html_no_tag(self):
         node = LeafNode(None, "Apply Here")
         self.assertEqual(node.to_html(), "Apply Here")
@@ -41,6 +52,14 @@ class TestHtmlNode(unittest.TestCase):
     def test_repr_leaf_node(self):
         node = LeafNode("b", "Apply Here")
         self.assertEqual(repr(node), "LeafNode(b, Apply Here, None)")
+
+    def test_repr_parent_node(self):
+        node = ParentNode("p", [LeafNode("b", "bold"), LeafNode(None, "text")])
+        self.assertEqual(repr(node), "ParentNode(p, children: 2 children, None)")
+        self.assertEqual(
+            node.debug_repr(),
+            "ParentNode(p, children: [LeafNode(b, bold, None), LeafNode(None, text, None)], None)"
+        )
     
     def test_to_html_with_children(self):
         child1_node = LeafNode("span", "child")
@@ -86,5 +105,20 @@ class TestHtmlNode(unittest.TestCase):
             "<div><div></div></div>"
         )
 
+    def test_to_html_deeply_nested(self):
+        node = LeafNode("b", "deep")
+        for _ in range(5000):
+            node = ParentNode("span", [node])
+        html = node.to_html()
+        self.assertTrue(html.startswith("<span><span>"))
+        self.assertEqual(html.count("</span>"), 5000)
+
+    def test_render_to_matches_to_html(self):
+        child_node = ParentNode("span", [LeafNode("b", "bold"), LeafNode(None, " text")])
+        parent_node = ParentNode("div", [child_node, LeafNode("a", "link", {"href": "/x"})])
+        file_writer = io.StringIO()
+        parent_node.render_to(file_writer)
+        self.assertEqual(file_writer.getvalue(), parent_node.to_html())
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -4,6 +4,7 @@ from markdown_block import (
     block_to_block_type,
     markdown_to_html_node, 
     extract_title,
+    markdown_to_page,
     BlockType
 )
 
@@ -65,6 +66,10 @@ This is the same paragraph on a new line with an ![image](www.google.com)
         self.assertEqual(block_to_block_type(block), BlockType.UNORDERED_LIST)
         block = "1. list\n2. items"
         self.assertEqual(block_to_block_type(block), BlockType.ORDERED_LIST)
+        block = "01. list\n02. items"
+        self.assertEqual(block_to_block_type(block), BlockType.ORDERED_LIST)
+        block = "\u0661. list\n\u0662. items"
+        self.assertEqual(block_to_block_type(block), BlockType.ORDERED_LIST)
         block = "paragraph"
         self.assertEqual(block_to_block_type(block), BlockType.PARAGRAPH)
         block = "1. list\n3. items"
@@ -208,6 +213,16 @@ of text
         )
         self.assertEqual(actual, "title")
 
+    def test_markdown_to_page(self):
+        md = """
+# My page
+
+Some **bold** text
+"""
+        title, node = markdown_to_page(md)
+        self.assertEqual(title, "My page")
+        self.assertEqual(node.to_html(), markdown_to_html_node(md).to_html())
+
     def test_none(self):
         try:
             extract_title(
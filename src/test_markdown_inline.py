@@ -11,33 +11,36 @@ from markdown_inline import (
 )
 
 class TestMarkdownInline(unittest.TestCase):
-    def test_split_nodes_delimiter_bold(self):
-        node = TextNode("Hi, I'm a very **bold** person!", TextType.TEXT)
-        nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
-        self.assertEqual(nodes, [
-            TextNode("Hi, I'm a very ", TextType.TEXT),
-            TextNode("bold", TextType.BOLD),
-            TextNode(" person!", TextType.TEXT)
-        ])
-    
-    def test_split_nodes_delimiter_italic(self):
-        node = TextNode("Hi, I'm a very _italicy_ person!", TextType.TEXT)
-        nodes = split_nodes_delimiter([node], "_", TextType.ITALIC)
-        self.assertEqual(nodes, [
-            TextNode("Hi, I'm a very ", TextType.TEXT),
-            TextNode("italicy", TextType.ITALIC),
-            TextNode(" person!", TextType.TEXT)
-        ])
-    
-    def test_split_nodes_delimiter_code(self):
-        node = TextNode("Hi, I'm a very `programmatic` person!", TextType.TEXT)
-        nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        self.assertEqual(nodes, [
-            TextNode("Hi, I'm a very ", TextType.TEXT),
-            TextNode("programmatic", TextType.CODE),
-            TextNode(" person!", TextType.TEXT)
-        ])
-    
+    def test_split_nodes_delimiter(self):
+        cases = [
+            ("bold", "Hi, I'm a very **bold** person!", "**", TextType.BOLD, [
+                TextNode("Hi, I'm a very ", TextType.TEXT),
+                TextNode("bold", TextType.BOLD),
+                TextNode(" person!", TextType.TEXT)
+            ]),
+            ("italic", "Hi, I'm a very _italicy_ person!", "_", TextType.ITALIC, [
+                TextNode("Hi, I'm a very ", TextType.TEXT),
+                TextNode("italicy", TextType.ITALIC),
+                TextNode(" person!", TextType.TEXT)
+            ]),
+            ("code", "Hi, I'm a very `programmatic` person!", "`", TextType.CODE, [
+                TextNode("Hi, I'm a very ", TextType.TEXT),
+                TextNode("programmatic", TextType.CODE),
+                TextNode(" person!", TextType.TEXT)
+            ]),
+            ("code_multiple", "Hi, I'm a very `programmatic` and `pragmatic` person!", "`", TextType.CODE, [
+                TextNode("Hi, I'm a very ", TextType.TEXT),
+                TextNode("programmatic", TextType.CODE),
+                TextNode(" and ", TextType.TEXT),
+                TextNode("pragmatic", TextType.CODE),
+                TextNode(" person!", TextType.TEXT)
+            ]),
+        ]
+        for name, text, delimiter, text_type, expected in cases:
+            with self.subTest(case=name):
+                nodes = split_nodes_delimiter([TextNode(text, TextType.TEXT)], delimiter, text_type)
+                self.assertListEqual(expected, nodes)
+
     def test_split_nodes_delimeter_bold_and_italic(self):
         node = TextNode("**bold** and _italic_", TextType.TEXT)
         nodes = split_nodes_delimiter([node], "**", TextType.BOLD)
@@ -51,17 +54,10 @@ class TestMarkdownInline(unittest.TestCase):
             nodes,
         )
     
-    def test_split_nodes_delimeter_code_multiple(self):
-        node = TextNode("Hi, I'm a very `programmatic` and `pragmatic` person!", TextType.TEXT)
-        nodes = split_nodes_delimiter([node], "`", TextType.CODE)
-        self.assertEqual([
-            TextNode("Hi, I'm a very ", TextType.TEXT),
-            TextNode("programmatic", TextType.CODE),
-            TextNode(" and ", TextType.TEXT),
-            TextNode("pragmatic", TextType.CODE),
-            TextNode(" person!", TextType.TEXT)
-        ], nodes)
-    
+    def test_split_nodes_delimeter_drops_empty_text(self):
+        nodes = split_nodes_delimiter([TextNode("", TextType.TEXT)], "**", TextType.BOLD)
+        self.assertListEqual([], nodes)
+
     def test_split_nodes_delimeter_bad_format(self):
         node = TextNode("Hi, I'm a very `programmatic person!", TextType.TEXT)
         with self.assertRaises(ValueError):
@@ -103,201 +99,89 @@ class TestMarkdownInline(unittest.TestCase):
         )
         self.assertListEqual([("", "")], matches)
 
-    def test_split_images_equal_parts_text_first(self):
-        node = TextNode(
-            "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
+    def test_split_nodes_image(self):
+        cases = [
+            ("equal_parts_text_first",
+                "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)", [
                 TextNode("This is text with an ", TextType.TEXT),
                 TextNode("image", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"
-                ),
-            ],
-            new_nodes,
-        )
-
-    def test_split_images_equal_parts_image_first(self):
-        node = TextNode(
-            "![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png) beautiful image",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
+                TextNode("second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"),
+            ]),
+            ("equal_parts_image_first",
+                "![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png) beautiful image", [
                 TextNode("image", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"
-                ),
+                TextNode("second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"),
                 TextNode(" beautiful image", TextType.TEXT),
-            ],
-            new_nodes,
-        )
-
-    def test_split_images_more_text(self):
-        node = TextNode(
-            "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another one!",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
+            ]),
+            ("more_text",
+                "This is text with an ![image](https://i.imgur.com/zjjcJKZ.png) and another one!", [
                 TextNode("This is text with an ", TextType.TEXT),
                 TextNode("image", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another one!", TextType.TEXT),
-            ],
-            new_nodes,
-        )
-
-    def test_split_images_more_images(self):
-        node = TextNode(
-            "![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
+            ]),
+            ("more_images",
+                "![image](https://i.imgur.com/zjjcJKZ.png) and another ![second image](https://i.imgur.com/3elNhQu.png)", [
                 TextNode("image", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"
-                ),
-            ],
-            new_nodes,
-        )
-
-    def test_split_images_all_text(self):
-        node = TextNode(
-            "No pictures here!",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
+                TextNode("second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"),
+            ]),
+            ("all_text", "No pictures here!", [
                 TextNode("No pictures here!", TextType.TEXT),
-            ],
-            new_nodes,
-        )
-    
-    def test_split_images_all_pictures(self):
-        node = TextNode(
-            "![image](https://i.imgur.com/zjjcJKZ.png)![second image](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_image([node])
-        self.assertListEqual(
-            [
+            ]),
+            ("all_pictures",
+                "![image](https://i.imgur.com/zjjcJKZ.png)![second image](https://i.imgur.com/3elNhQu.png)", [
                 TextNode("image", TextType.IMAGE, "https://i.imgur.com/zjjcJKZ.png"),
-                TextNode(
-                    "second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"
-                ),
-            ],
-            new_nodes,
-        )
-
-
-
-    def test_split_links_equal_parts_text_first(self):
-        node = TextNode(
-            "This is text with a [link](https://i.imgur.com/zjjcJKZ.png) and another [link2](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
+                TextNode("second image", TextType.IMAGE, "https://i.imgur.com/3elNhQu.png"),
+            ]),
+        ]
+        for name, text, expected in cases:
+            with self.subTest(case=name):
+                new_nodes = split_nodes_image([TextNode(text, TextType.TEXT)])
+                self.assertListEqual(expected, new_nodes)
+
+    def test_split_nodes_link(self):
+        cases = [
+            ("equal_parts_text_first",
+                "This is text with a [link](https://i.imgur.com/zjjcJKZ.png) and another [link2](https://i.imgur.com/3elNhQu.png)", [
                 TextNode("This is text with a ", TextType.TEXT),
                 TextNode("link", TextType.LINK, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"
-                ),
-            ],
-            new_nodes,
-        )
-
-    def test_split_links_equal_parts_link_first(self):
-        node = TextNode(
-            "[link](https://i.imgur.com/zjjcJKZ.png) and another [link2](https://i.imgur.com/3elNhQu.png) beautiful link",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
+                TextNode("link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"),
+            ]),
+            ("equal_parts_link_first",
+                "[link](https://i.imgur.com/zjjcJKZ.png) and another [link2](https://i.imgur.com/3elNhQu.png) beautiful link", [
                 TextNode("link", TextType.LINK, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"
-                ),
+                TextNode("link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"),
                 TextNode(" beautiful link", TextType.TEXT),
-            ],
-            new_nodes,
-        )
-
-    def test_split_links_more_text(self):
-        node = TextNode(
-            "This is text with a [link](https://i.imgur.com/zjjcJKZ.png) and another one!",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
+            ]),
+            ("more_text",
+                "This is text with a [link](https://i.imgur.com/zjjcJKZ.png) and another one!", [
                 TextNode("This is text with a ", TextType.TEXT),
                 TextNode("link", TextType.LINK, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another one!", TextType.TEXT),
-            ],
-            new_nodes,
-        )
-
-    def test_split_links_more_links(self):
-        node = TextNode(
-            "[link](https://i.imgur.com/zjjcJKZ.png) and another [link2](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
+            ]),
+            ("more_links",
+                "[link](https://i.imgur.com/zjjcJKZ.png) and another [link2](https://i.imgur.com/3elNhQu.png)", [
                 TextNode("link", TextType.LINK, "https://i.imgur.com/zjjcJKZ.png"),
                 TextNode(" and another ", TextType.TEXT),
-                TextNode(
-                    "link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"
-                ),
-            ],
-            new_nodes,
-        )
-
-    def test_split_links_all_text(self):
-        node = TextNode(
-            "No links here!",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
+                TextNode("link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"),
+            ]),
+            ("all_text", "No links here!", [
                 TextNode("No links here!", TextType.TEXT),
-            ],
-            new_nodes,
-        )
-    
-    def test_split_links_all_links(self):
-        node = TextNode(
-            "[link](https://i.imgur.com/zjjcJKZ.png)[link2](https://i.imgur.com/3elNhQu.png)",
-            TextType.TEXT,
-        )
-        new_nodes = split_nodes_link([node])
-        self.assertListEqual(
-            [
+            ]),
+            ("all_links",
+                "[link](https://i.imgur.com/zjjcJKZ.png)[link2](https://i.imgur.com/3elNhQu.png)", [
                 TextNode("link", TextType.LINK, "https://i.imgur.com/zjjcJKZ.png"),
-                TextNode(
-                    "link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"
-                ),
-            ],
-            new_nodes,
-        )
+                TextNode("link2", TextType.LINK, "https://i.imgur.com/3elNhQu.png"),
+            ]),
+        ]
+        for name, text, expected in cases:
+            with self.subTest(case=name):
+                new_nodes = split_nodes_link([TextNode(text, TextType.TEXT)])
+                self.assertListEqual(expected, new_nodes)
 
     def test_text_to_text_nodes(self):
         text = "This is **text** with an _italic_ word and a `code block` and an ![obi wan image](https://i.imgur.com/fJRm4Vk.jpeg) and a [link](https://boot.dev)"
@@ -318,5 +202,45 @@ class TestMarkdownInline(unittest.TestCase):
             new_nodes,
         )
 
+    def test_text_to_text_nodes_matches_split_passes(self):
+        cases = [
+            ("triple_backticks", "Use ```code``` inline", [
+                TextNode("Use ", TextType.TEXT),
+                TextNode("code", TextType.CODE),
+                TextNode(" inline", TextType.TEXT),
+            ]),
+            ("fenced_code_in_paragraph", "Run this: ``` ls -la ```", [
+                TextNode("Run this: ", TextType.TEXT),
+                TextNode(" ls -la ", TextType.CODE),
+            ]),
+            ("star_inside_bold", "**a*b**", [
+                TextNode("a*b", TextType.BOLD),
+            ]),
+            ("triple_star", "***b**", [
+                TextNode("*b", TextType.BOLD),
+            ]),
+            ("double_underscores", "__init__ is **special**", [
+                TextNode("init", TextType.TEXT),
+                TextNode(" is ", TextType.TEXT),
+                TextNode("special", TextType.BOLD),
+            ]),
+            ("empty_italic_spans", "a ____ b", [
+                TextNode("a ", TextType.TEXT),
+                TextNode(" b", TextType.TEXT),
+            ]),
+            ("bold_inside_link_text", "[a**b**](u)", [
+                TextNode("[a", TextType.TEXT),
+                TextNode("b", TextType.BOLD),
+                TextNode("](u)", TextType.TEXT),
+            ]),
+        ]
+        for name, text, expected in cases:
+            with self.subTest(case=name):
+                self.assertListEqual(expected, text_to_text_nodes(text))
+
+    def test_text_to_text_nodes_bad_format(self):
+        with self.assertRaises(ValueError):
+            text_to_text_nodes("This is **not closed")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from textnode import TextNode, TextType, text_node_to_html_node
@@ -33,6 +35,12 @@ class TestTextNode(unittest.TestCase):
         node2 = TextNode("i'm a test", TextType.BOLD)
         self.assertNotEqual(node1, node2)
     
+    def test_copy_and_pickle_round_trip(self):
+        node = TextNode("I'm a test", TextType.LINK, "https://www.boot.dev")
+        self.assertEqual(node, copy.copy(node))
+        self.assertEqual(node, copy.deepcopy(node))
+        self.assertEqual(node, pickle.loads(pickle.dumps(node)))
+
     def test_repr(self):
         node = TextNode("I'm a test", TextType.IMAGE, "www.google.com")
         self.assertEqual(repr(node), "TextNode(I'm a test, image, www.google.com)")
@@ -60,5 +68,17 @@ class TestTextNodeToHTMLNode(unittest.TestCase):
         self.assertEqual(html_node.tag, "b")
         self.assertEqual(html_node.value, "This is bold")
 
+    def test_identical_nodes_share_html_node(self):
+        html_node1 = text_node_to_html_node(TextNode("shared", TextType.ITALIC))
+        html_node2 = text_node_to_html_node(TextNode("shared", TextType.ITALIC))
+        self.assertIs(html_node1, html_node2)
+
+    def test_long_nodes_are_not_cached(self):
+        text = "x" * 1000
+        html_node1 = text_node_to_html_node(TextNode(text, TextType.CODE))
+        html_node2 = text_node_to_html_node(TextNode(text, TextType.CODE))
+        self.assertIsNot(html_node1, html_node2)
+        self.assertEqual(html_node1.value, text)
+
 if __name__ == "__main__":
     unittest.main()
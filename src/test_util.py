@@ -0,0 +1,103 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+import util
+from util import _collect_files_to_copy, copy_contents_from_src_to_dest, generate_pages_recursive
+
+class TestCopyContents(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self.tmp_dir.name, "static")
+        self.dest = os.path.join(self.tmp_dir.name, "public")
+        os.makedirs(os.path.join(self.src, "images"))
+        with open(os.path.join(self.src, "index.css"), "w") as file_writer:
+            file_writer.write("body {}")
+        with open(os.path.join(self.src, "images", "logo.png"), "wb") as file_writer:
+            file_writer.write(b"\x89PNG")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_copy_contents(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            copy_contents_from_src_to_dest(self.src, self.dest)
+        with open(os.path.join(self.dest, "index.css")) as file_reader:
+            self.assertEqual("body {}", file_reader.read())
+        with open(os.path.join(self.dest, "images", "logo.png"), "rb") as file_reader:
+            self.assertEqual(b"\x89PNG", file_reader.read())
+
+    def test_second_copy_queues_nothing(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            copy_contents_from_src_to_dest(self.src, self.dest)
+
+        src_paths = []
+        dest_paths = []
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            _collect_files_to_copy(self.src, self.dest, src_paths, dest_paths)
+        self.assertListEqual([], src_paths)
+        self.assertListEqual([], dest_paths)
+        self.assertNotIn("index.css", output.getvalue())
+        self.assertNotIn("logo.png", output.getvalue())
+
+class TestGeneratePages(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.content = os.path.join(self.tmp_dir.name, "content")
+        self.dest = os.path.join(self.tmp_dir.name, "public")
+        self.template_path = os.path.join(self.tmp_dir.name, "template.html")
+        with open(self.template_path, "w") as file_writer:
+            file_writer.write(
+                '<title>{{ Title }}</title><link href="/index.css" />'
+                '<article>{{ Content }}</article>'
+            )
+        self.page_paths = []
+        for i in range(40):
+            page_path = os.path.join(f"section{i % 4}", f"page{i}") if i % 2 else f"page{i}"
+            os.makedirs(os.path.join(self.content, os.path.dirname(page_path)), exist_ok=True)
+            with open(os.path.join(self.content, page_path + ".md"), "w") as file_writer:
+                file_writer.write(f"# Page {i}\n\nSee [home](/) and ![logo](/images/logo.png).")
+            self.page_paths.append(page_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def assert_pages_generated(self):
+        for i, page_path in enumerate(self.page_paths):
+            with open(os.path.join(self.dest, page_path + ".html"), encoding="utf-8") as file_reader:
+                self.assertEqual(
+                    f'<title>Page {i}</title><link href="/blog/index.css" />'
+                    f'<article><div><h1>Page {i}</h1><p>See <a href="/blog/">home</a> and '
+                    f'<img src="/blog/images/logo.png" alt="logo"></img>.</p></div></article>',
+                    file_reader.read(),
+                )
+
+    def test_generate_pages_recursive_process_pool(self):
+        self.assertGreaterEqual(len(self.page_paths), util._PARALLEL_PAGE_THRESHOLD)
+        # Pretend to have several CPUs so the pool is used even on a single-core machine.
+        with mock.patch("os.cpu_count", return_value=2):
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_pages_recursive(self.content, self.template_path, self.dest, "/blog/")
+        self.assert_pages_generated()
+
+    def test_generate_pages_recursive_in_process(self):
+        with mock.patch.object(util, "_PARALLEL_PAGE_THRESHOLD", len(self.page_paths) + 1):
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_pages_recursive(self.content, self.template_path, self.dest, "/blog/")
+        self.assert_pages_generated()
+
+    def test_url_split_across_leaves_is_rewritten(self):
+        with open(os.path.join(self.content, "page0.md"), "w") as file_writer:
+            file_writer.write('# Page 0\n\nsee href="****/x')
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_pages_recursive(self.content, self.template_path, self.dest, "/blog/")
+        with open(os.path.join(self.dest, "page0.html"), encoding="utf-8") as file_reader:
+            self.assertIn('<p>see href="/blog/x</p>', file_reader.read())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,12 @@
 from enum import Enum
+import functools
 
 from htmlnode import LeafNode
 
-class TextType(Enum):
+class TextType(str, Enum):
     """
     An enumeration representing different types of text formatting.
+    Members are also str instances equal to their values, so they hash and compare as plain strings.
 
     Attributes:
         TEXT: Represents plain text.
@@ -25,6 +27,9 @@ class TextNode():
     """
     Represents a node of text with an associated type and optional URL.
 
+    TextNodes must not be mutated once constructed: the inline parser shares
+    instances for repeated text runs and they are used as cache keys.
+
     Attributes:
         text (str): The textual content of the node.
         text_type (Enum): The type/category of the text (e.g., plain, bold, link).
@@ -33,27 +38,47 @@ class TextNode():
     Methods:
         __init__(text, text_type, url=None): Initializes a TextNode instance.
         __eq__(other): Checks equality with another TextNode based on attributes.
+        __hash__(): Hashes the node by the same attributes used for equality.
         __repr__(): Returns a string representation of the TextNode.
     """
+    __slots__ = ("text", "text_type", "url")
+
     def __init__(self, text, text_type, url=None):
         self.text = text
         self.text_type = text_type
         self.url = url
 
     def __eq__(self, other):
-        return (
-            self.text == other.text 
-            and self.text_type == other.text_type 
-            and self.url == other.url
-        )
+        if not isinstance(other, TextNode):
+            return NotImplemented
+        return (self.text, self.text_type, self.url) == (other.text, other.text_type, other.url)
+
+    def __hash__(self):
+        return hash((self.text, self.text_type, self.url))
 
     def __repr__(self):
-        return f"TextNode({self.text}, {self.text_type.value}, {self.url})"
-        
+        return "TextNode(%s, %s, %s)" % (self.text, self.text_type.value, self.url)
+
+_HTML_NODE_BUILDERS = {
+    TextType.TEXT: lambda text_node: LeafNode(None, text_node.text),
+    TextType.BOLD: lambda text_node: LeafNode("b", text_node.text),
+    TextType.ITALIC: lambda text_node: LeafNode("i", text_node.text),
+    TextType.CODE: lambda text_node: LeafNode("code", text_node.text),
+    TextType.LINK: lambda text_node: LeafNode("a", text_node.text, {"href": text_node.url}),
+    TextType.IMAGE: lambda text_node: LeafNode("img", "", {"src": text_node.url, "alt": text_node.text}),
+}
+
+_CACHED_HTML_NODE_MAX_LEN = 16
+
 def text_node_to_html_node(text_node):
     """
     Converts a TextNode object into a corresponding HTML node.
 
+    Short text nodes (at most 16 characters) are cached by their (text, text_type, url),
+    so identical inline runs share a single LeafNode; longer ones, such as whole
+    paragraphs or code blocks, are converted without caching. A returned node may be
+    shared and must not be mutated.
+
     Args:
         text_node (TextNode): The text node to convert. Must have attributes 'text_type', 'text', and optionally 'url'.
 
@@ -63,18 +88,17 @@ def text_node_to_html_node(text_node):
     Raises:
         ValueError: If the text_type of the text_node is not recognized.
     """
-    match text_node.text_type:
-        case TextType.TEXT:
-            return LeafNode(None, text_node.text)
-        case TextType.BOLD:
-            return LeafNode("b", text_node.text)
-        case TextType.ITALIC:
-            return LeafNode("i", text_node.text)
-        case TextType.CODE:
-            return LeafNode("code", text_node.text)
-        case TextType.LINK:
-            return LeafNode("a", text_node.text, {"href": text_node.url})
-        case TextType.IMAGE:
-            return LeafNode("img", "", {"src": text_node.url, "alt": text_node.text})
-        case _:
-            raise ValueError(f"Invalid text type: {text_node.text_type}")
+    if len(text_node.text) <= _CACHED_HTML_NODE_MAX_LEN:
+        return _cached_text_node_to_html_node(text_node)
+    return _build_html_node(text_node)
+
+@functools.lru_cache(maxsize=4096)
+def _cached_text_node_to_html_node(text_node):
+    return _build_html_node(text_node)
+
+def _build_html_node(text_node):
+    try:
+        build_html_node = _HTML_NODE_BUILDERS[text_node.text_type]
+    except KeyError:
+        raise ValueError(f"Invalid text type: {text_node.text_type}") from None
+    return build_html_node(text_node)
@@ -1,14 +1,17 @@
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import os
-from pathlib import Path
+import re
 import shutil
-from markdown_block import markdown_to_html_node, extract_title
 
 def copy_contents_from_src_to_dest(src, dest):
     """
     Recursively copies the contents of the source directory (`src`) to the destination directory (`dest`).
 
     If the destination directory does not exist, it is created. All files and subdirectories from the source
-    are copied to the destination, preserving the directory structure.
+    are copied to the destination, preserving the directory structure. Directories are created while walking
+    the tree, and the file copies are then dispatched to a thread pool so their I/O overlaps. Files whose
+    destination already has the same size and is at least as new as the source are skipped.
 
     Args:
         src (str): Path to the source directory.
@@ -19,17 +22,109 @@ def copy_contents_from_src_to_dest(src, dest):
         PermissionError: If the operation lacks the necessary permissions.
         OSError: For other OS-related errors during file or directory operations.
     """
+    src_paths = []
+    dest_paths = []
+    _collect_files_to_copy(src, dest, src_paths, dest_paths)
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(shutil.copyfile, src_paths, dest_paths))
+
+def _collect_files_to_copy(src, dest, src_paths, dest_paths):
+    """
+    Walks `src` with os.scandir, mirroring its directories under `dest` and collecting
+    every file that needs copying as a (source, destination) pair in `src_paths` and `dest_paths`.
+    Only directories and queued files are printed; up-to-date files are skipped silently.
+    """
     if not os.path.exists(dest):
         os.mkdir(dest)
 
-    for item in os.listdir(src):
-        src_full_path = os.path.join(src, item)
-        dest_full_path = os.path.join(dest, item)
-        print(f"{src_full_path} -> {dest_full_path}")
-        if os.path.isfile(src_full_path):
-            shutil.copy(src_full_path, dest_full_path)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            dest_full_path = os.path.join(dest, entry.name)
+            if entry.is_dir():
+                print(f"{entry.path} -> {dest_full_path}")
+                _collect_files_to_copy(entry.path, dest_full_path, src_paths, dest_paths)
+            elif not _is_up_to_date(entry, dest_full_path):
+                print(f"{entry.path} -> {dest_full_path}")
+                src_paths.append(entry.path)
+                dest_paths.append(dest_full_path)
+
+def _is_up_to_date(src_entry, dest_path):
+    """
+    Returns True if dest_path already holds a copy of src_entry: same size and not older.
+    """
+    try:
+        dest_stat = os.stat(dest_path)
+    except FileNotFoundError:
+        return False
+    src_stat = src_entry.stat()
+    return src_stat.st_size == dest_stat.st_size and src_stat.st_mtime <= dest_stat.st_mtime
+
+_TEMPLATE_PLACEHOLDER_RE = re.compile(r"(\{\{ Title \}\}|\{\{ Content \}\})")
+
+_PARALLEL_PAGE_THRESHOLD = 32
+
+def rewrite_absolute_urls(html, basepath):
+    """
+    Rewrites absolute URLs in href and src attributes to be rooted at the given basepath.
+
+    Args:
+        html (str): The HTML to rewrite.
+        basepath (str): Base path to prefix absolute URLs with.
+
+    Returns:
+        str: The HTML with 'href="/' and 'src="/' replaced by the basepath.
+    """
+    html = html.replace('href="/', f'href="{basepath}')
+    return html.replace('src="/', f'src="{basepath}')
+
+@functools.lru_cache(maxsize=8)
+def compile_template(template_path, basepath):
+    """
+    Reads an HTML template once and splits it on its placeholders, caching the result per process.
+
+    Absolute URLs in the template's literal text are rewritten to the basepath up front, and the
+    literal text is encoded to UTF-8 so it can be written to a binary file without further work.
+
+    Args:
+        template_path (str): Path to the HTML template file.
+        basepath (str): Base path to use for resolving absolute URLs in href and src attributes.
+
+    Returns:
+        tuple: Literal UTF-8 bytes chunks at even indices and placeholder names
+        ('{{ Title }}' or '{{ Content }}') at odd indices.
+    """
+    with open(template_path, "r", encoding="utf-8") as file_reader:
+        template_content = file_reader.read()
+    chunks = _TEMPLATE_PLACEHOLDER_RE.split(template_content)
+    for i in range(0, len(chunks), 2):
+        chunks[i] = rewrite_absolute_urls(chunks[i], basepath).encode("utf-8")
+    return tuple(chunks)
+
+def render_template_to(file_writer, template_chunks, title, content_node, basepath):
+    """
+    Writes a compiled template to a file, filling its placeholders with the page title and content.
+
+    The template's literal chunks are written as-is, since compile_template already rewrote their
+    URLs. The title and the content are each rendered in full, then have their absolute URLs
+    rewritten once and are encoded before being written, so a URL split across adjacent leaves
+    of the content tree is still rewritten.
+
+    Args:
+        file_writer: A binary file-like object with a write(bytes) method.
+        template_chunks (tuple): A template as returned by compile_template.
+        title (str): The value for '{{ Title }}'.
+        content_node (HTMLNode): The node rendered in place of '{{ Content }}'.
+        basepath (str): Base path to use for resolving absolute URLs in href and src attributes.
+    """
+    for i, chunk in enumerate(template_chunks):
+        if i % 2 == 0:
+            file_writer.write(chunk)
+        elif chunk == "{{ Title }}":
+            file_writer.write(rewrite_absolute_urls(title, basepath).encode("utf-8"))
         else:
-            copy_contents_from_src_to_dest(src_full_path, dest_full_path)
+            file_writer.write(rewrite_absolute_urls(content_node.to_html(), basepath).encode("utf-8"))
 
 def generate_page(from_path, template_path, dest_path, basepath):
     """
@@ -43,33 +138,42 @@ def generate_page(from_path, template_path, dest_path, basepath):
 
     The function reads the Markdown content, converts it to HTML, extracts the title,
     and injects both into the template. It also rewrites absolute URLs in the template
-    to use the provided basepath. The resulting HTML is written to the destination path,
-    creating directories as needed.
+    to use the provided basepath. The resulting HTML is written to the destination path
+    section by section, creating directories as needed.
     """
     print(f"Generating from {from_path} to {dest_path} using {template_path}")
-    with open(from_path, "r", encoding="utf-8") as file_reader:
-        md_content = file_reader.read()
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    generate_page_from_template(from_path, compile_template(template_path, basepath), dest_path, basepath)
 
-    with open(template_path, "r", encoding="utf-8") as file_reader:
-        template_content = file_reader.read()
+def generate_page_from_template(from_path, template_chunks, dest_path, basepath):
+    """
+    Generates an HTML page from a Markdown source file using an already compiled template.
 
-    html_content = markdown_to_html_node(md_content).to_html()
-    html_title = extract_title(md_content)
+    Args:
+        from_path (str): Path to the source Markdown file.
+        template_chunks (tuple): A template as returned by compile_template.
+        dest_path (str): Destination path for the generated HTML file. Its directory must already exist.
+        basepath (str): Base path to use for resolving absolute URLs in href and src attributes.
+    """
+    with open(from_path, "r", encoding="utf-8") as file_reader:
+        md_content = file_reader.read()
 
-    template_content = template_content.replace("{{ Title }}", html_title)
-    template_content = template_content.replace("{{ Content }}", html_content)
-    template_content = template_content.replace('href="/', f'href="{basepath}')
-    template_content = template_content.replace('src="/', f'src="{basepath}')
+    # Imported here so asset-only callers of this module skip loading the markdown parser.
+    from markdown_block import markdown_to_page
 
-    if not os.path.exists(dest_path):
-        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    html_title, html_node = markdown_to_page(md_content)
 
-    with open(dest_path, "w", encoding="utf-8") as file_writer:
-        file_writer.write(template_content)
+    with open(dest_path, "wb", buffering=1 << 20) as file_writer:
+        render_template_to(file_writer, template_chunks, html_title, html_node, basepath)
 
 def generate_pages_recursive(dir_path_content, template_path, dest_dir_path, basepath):
     """
     Recursively generates HTML pages from Markdown files in a directory tree using a specified template.
+
+    The template is read and compiled once, the content tree is walked to collect every
+    Markdown file, then the pages are rendered. Each page is independent, so sites with at
+    least 32 pages on a multi-core machine are rendered across a process pool; smaller
+    sites are rendered in-process, where starting the pool would cost more than it saves.
     Args:
         dir_path_content (str): Path to the root directory containing Markdown files and subdirectories.
         template_path (str): Path to the HTML template file to use for page generation.
@@ -84,15 +188,50 @@ def generate_pages_recursive(dir_path_content, template_path, dest_dir_path, bas
     if not os.path.exists(template_path):
         raise FileNotFoundError("Invalid path for template given")
 
-    for item in os.listdir(dir_path_content):
-        src_full_path = os.path.join(dir_path_content, item)
-        dest_full_path = os.path.join(dest_dir_path, item)
-        if os.path.isfile(src_full_path) and Path(item).suffix == ".md":
-            dest_full_path = Path(dest_full_path).with_suffix(".html")
-            generate_page(src_full_path, template_path, dest_full_path, basepath)
-        else:
-            generate_pages_recursive(src_full_path, template_path, dest_full_path, basepath)
-    
-
+    page_jobs = []
+    for root, _, files in os.walk(dir_path_content):
+        md_files = [item for item in files if item.endswith(".md")]
+        if not md_files:
+            continue
+        dest_root = os.path.normpath(os.path.join(dest_dir_path, os.path.relpath(root, dir_path_content)))
+        os.makedirs(dest_root, exist_ok=True)
+        for item in md_files:
+            src_full_path = os.path.join(root, item)
+            dest_full_path = os.path.join(dest_root, item[:-3] + ".html")
+            print(f"Generating from {src_full_path} to {dest_full_path} using {template_path}")
+            page_jobs.append((src_full_path, dest_full_path))
+
+    if not page_jobs:
+        return
+
+    template_chunks = compile_template(template_path, basepath)
+    if len(page_jobs) < _PARALLEL_PAGE_THRESHOLD or (os.cpu_count() or 1) == 1:
+        for from_path, dest_path in page_jobs:
+            generate_page_from_template(from_path, template_chunks, dest_path, basepath)
+        return
+
+    # Imported here so small sites skip loading multiprocessing entirely.
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(
+        initializer=_init_page_worker,
+        initargs=(template_chunks, basepath)
+    ) as executor:
+        list(executor.map(_generate_page_job, page_jobs, chunksize=8))
+
+_worker_template_chunks = None
+_worker_basepath = None
+
+def _init_page_worker(template_chunks, basepath):
+    """
+    Process pool initializer that stores the compiled template and basepath once per worker.
+    """
+    global _worker_template_chunks, _worker_basepath
+    _worker_template_chunks = template_chunks
+    _worker_basepath = basepath
 
-    
\ No newline at end of file
+def _generate_page_job(page_job):
+    """
+    Generates one (source, destination) page using the worker's template and basepath.
+    """
+    from_path, dest_path = page_job
+    generate_page_from_template(from_path, _worker_template_chunks, dest_path, _worker_basepath)